@@ -33,8 +33,8 @@ class FuelWarn(QtCore.QObject):
         self._warned = False
         self._alert_widget = alert_widget
         self._journal = None
-        self.player = QtMultimedia.QMediaPlayer(self)
-        self.player.audio_output = self.audio_output = QtMultimedia.QAudioOutput(self)
+        self._sound_effect: QtMultimedia.QSoundEffect | None = None
+        self._player: QtMultimedia.QMediaPlayer | None = None
 
     def set_journal(self, journal: Journal) -> None:
         """Set the journal to get the ship values from."""
@@ -49,6 +49,7 @@ class FuelWarn(QtCore.QObject):
             return
 
         status_flags = status_dict["Flags"]
+        main_fuel = status_dict["Fuel"]["FuelMain"]
         fuel_threshold = (
             self._journal.ship.fsd.max_fuel_usage * settings.Alerts.threshold / 100
         )
@@ -56,15 +57,13 @@ class FuelWarn(QtCore.QObject):
             not self._warned
             and status_flags & IN_SUPERCRUISE_FLAG
             and status_flags & FSD_COOLDOWN_FLAG
-            and status_dict["Fuel"]["FuelMain"] < fuel_threshold
+            and main_fuel < fuel_threshold
         ):
-            log.info(
-                f"Executing alert, {fuel_threshold=} ship_fuel={status_dict['Fuel']['FuelMain']}"
-            )
+            log.info(f"Executing alert, {fuel_threshold=} ship_fuel={main_fuel}")
             self._execute_alert()
             self._warned = True
 
-        elif self._warned and status_dict["Fuel"]["FuelMain"] > fuel_threshold:
+        elif self._warned and main_fuel > fuel_threshold:
             log.debug("Resetting warned state.")
             self._warned = False
 
@@ -73,18 +72,15 @@ class FuelWarn(QtCore.QObject):
         Execute an alert.
 
         If the audio alerts are enable and there is no path defined, use the default system alert,
-        otherwise if the user provided a path, play it through the global QMediaPlayer instance.
+        otherwise if the user provided a path, play it through `_play_sound_file`.
 
         If the visual alert is enabled, attempt to flash the taskbar icon for 5 seconds.
         """
         log.info("Attempting to execute fuel alert.")
         if settings.Alerts.audio:
             if settings.Paths.alert_sound:
-                new_url = QtCore.QUrl.from_local_file(str(settings.Paths.alert_sound))
-                if new_url != self.player.source:
-                    self.player.source = new_url
                 log.info(f"Playing file {settings.Paths.alert_sound} for alert.")
-                self.player.play()
+                self._play_sound_file(str(settings.Paths.alert_sound))
 
             else:
                 get_application().beep()
@@ -93,3 +89,25 @@ class FuelWarn(QtCore.QObject):
         if settings.Alerts.visual:
             get_application().alert(self._alert_widget, 5000)
             log.info("Executed flash alert.")
+
+    def _play_sound_file(self, path: str) -> None:
+        """
+        Play the sound file at `path`.
+
+        WAV files are played through a QSoundEffect, other formats through a QMediaPlayer.
+        Both are only created when first needed.
+        """
+        new_url = QtCore.QUrl.from_local_file(path)
+        if path.lower().endswith(".wav"):
+            if self._sound_effect is None:
+                self._sound_effect = QtMultimedia.QSoundEffect(self)
+            if new_url != self._sound_effect.source:
+                self._sound_effect.source = new_url
+            self._sound_effect.play()
+        else:
+            if self._player is None:
+                self._player = QtMultimedia.QMediaPlayer(self)
+                self._player.audio_output = QtMultimedia.QAudioOutput(self)
+            if new_url != self._player.source:
+                self._player.source = new_url
+            self._player.play()
@@ -9,8 +9,7 @@ import typing as t
 from functools import partial
 
 import babel
-import more_itertools
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore
 from __feature__ import snake_case, true_property  # noqa: F401
 
 import auto_neutron.locale
@@ -23,7 +22,6 @@ from auto_neutron.plotters import AhkPlotter, CopyPlotter
 from auto_neutron.route import Route
 from auto_neutron.self_updater import Updater
 from auto_neutron.settings import delay_sync
-from auto_neutron.utils.signal import ReconnectingSignal
 from auto_neutron.windows import (
     ErrorWindow,
     LicenseWindow,
@@ -82,14 +80,11 @@ class Hub(QtCore.QObject):
 
         self.apply_settings()
 
-        self.edit_route_update_connection = ReconnectingSignal(
-            self.window.table.itemChanged, self.update_route_from_edit
-        )
-        self.edit_route_update_connection.connect()
+        self.window.table_model.item_edited.connect(self.update_route_from_edit)
 
         if (
             not JOURNAL_PATH.exists()
-            or not more_itertools.ilen(JOURNAL_PATH.glob("Journal.*.log"))
+            or not any(JOURNAL_PATH.glob("Journal.*.log"))
             or not (JOURNAL_PATH / "Status.json").exists()
         ):
             # If the journal folder is missing, force the user to quit
@@ -113,25 +108,21 @@ class Hub(QtCore.QObject):
             route_window.route_created_signal.connect(self.new_route)
             route_window.show()
 
-    @QtCore.Slot(QtWidgets.QTableWidgetItem)
-    def update_route_from_edit(self, table_item: QtWidgets.QTableWidgetItem) -> None:
-        """Edit the plotter's route with the new data in `table_item`."""
+    @QtCore.Slot(QtCore.QModelIndex)
+    def update_route_from_edit(self, index: QtCore.QModelIndex) -> None:
+        """Refresh the plotter's state after the route was edited at `index`."""
         log.debug(
-            f"Updating info from edited item at x={table_item.row()} y={table_item.column()}."
-        )
-        self.plotter_state.route.entries[table_item.row()][table_item.column()] = (
-            table_item.data(QtCore.Qt.ItemDataRole.DisplayRole)
+            f"Updating info from edited item at x={index.row()} y={index.column()}."
         )
-        if table_item.row() == self.plotter_state.route_index:
+        self.plotter_state.route.update_indices()
+        if index.row() == self.plotter_state.route_index:
             self.plotter_state.route_index = self.plotter_state.route_index
         self.window.update_remaining_count()
-        self.plotter_state.route.update_indices()
 
     @QtCore.Slot(object, int)
     def new_system_callback(self, _: t.Any, index: int) -> None:
-        """Ensure we don't edit the route when inactivating rows."""
-        with self.edit_route_update_connection.temporarily_disconnect():
-            self.window.set_current_row(index)
+        """Set the table's current row to `index`."""
+        self.window.set_current_row(index)
 
     @QtCore.Slot(QtCore.QModelIndex)
     def get_index_row(self, index: QtCore.QModelIndex) -> None:
@@ -153,10 +144,10 @@ class Hub(QtCore.QObject):
                 self.plotter_state.plotter = CopyPlotter()
             else:
                 self.plotter_state.plotter = AhkPlotter()
-        with self.edit_route_update_connection.temporarily_disconnect():
-            self.window.initialize_table(route)
+        self.window.initialize_table(route)
 
         self.window.scroll_to_index(self.plotter_state.route_index)
+        self.window.reset_column_widths()
         self.plotter_state.route_index = route.index
         if journal.location is not None:  # may not have a location yet
             self.plotter_state.tail_worker.emit_next_system(journal.location)
@@ -168,6 +159,7 @@ class Hub(QtCore.QObject):
         """Update the appearance and plotter with new settings."""
         log.debug("Refreshing settings.")
         self.window.table.font = settings.Window.font
+        self.window.reset_column_widths()
         if settings.Window.dark_mode is Theme.OS_THEME:
             dark = self._theme_listener.dark_theme
         else:
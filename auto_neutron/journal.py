@@ -4,10 +4,13 @@
 from __future__ import annotations
 
 import datetime
-import json
+import heapq
 import logging
+import os
+import re
 import typing as t
 from operator import attrgetter
+from pathlib import Path
 
 import more_itertools
 from PySide6 import QtCore
@@ -16,14 +19,16 @@ from __feature__ import snake_case, true_property  # noqa: F401
 from auto_neutron.constants import JOURNAL_PATH
 from auto_neutron.game_state import Location
 from auto_neutron.ship import Ship
-from auto_neutron.utils.utils import get_sector_midpoint
+from auto_neutron.utils.utils import get_sector_midpoint, json_loads
 
 if t.TYPE_CHECKING:
     import collections.abc
-    from pathlib import Path
 
 log = logging.getLogger(__name__)
 
+_TAIL_READ_SIZE = 64 * 1024
+_SHUT_DOWN_CHECK_SIZE = 1024
+
 
 class Journal(QtCore.QObject):
     """Keep track of a journal file and the state of the game from it."""
@@ -46,66 +51,145 @@ class Journal(QtCore.QObject):
         self.cmdr = None
 
         self._last_file_pos = 0
+        self._parsed = False
+        self._active_tailers: list[object] = []
 
     def tail(self) -> collections.abc.Generator[None, None, None]:
-        """Follow a log file, and emit signals for new systems, loadout changes and game shut down."""
+        """
+        Follow a log file, and emit signals for new systems, loadout changes and game shut down.
+
+        New data is read in chunks into a buffer, and only complete lines are parsed;
+        a partially written line is kept in the buffer until the rest of it arrives.
+        The generator yields every time it runs out of data to read.
+        Reading starts where the last parse stopped, or at the end of the file if the journal wasn't parsed before.
+
+        When multiple tailers of the journal are running, only the oldest one reads the file,
+        the others yield without reading until it's closed, and then continue where it stopped.
+        """
         log.info(f"Starting tailer of journal file {self.path.name} {id(self)=:x}.")
+        tailer_token = object()
+        self._active_tailers.append(tailer_token)
         try:
-            with self.path.open(encoding="utf8") as journal_file:
-                journal_file.seek(0, 2)
+            took_over = False
+            while self._active_tailers[0] is not tailer_token:
+                took_over = True
+                yield
+
+            with self.path.open("rb", buffering=0) as journal_file:
+                parse_line = self._parse_journal_line
+                if took_over or self._parsed:
+                    buffer_file_pos = journal_file.seek(self._last_file_pos)
+                else:
+                    buffer_file_pos = journal_file.seek(0, 2)
+                buffer = bytearray()
+                scan_pos = 0
                 while True:
-                    if line := journal_file.readline():
-                        self._last_file_pos = journal_file.tell()
-                        self._parse_journal_line(line)
-                    else:
+                    data = journal_file.read(_TAIL_READ_SIZE)
+                    if not data:
                         yield
+                        continue
+
+                    buffer += data
+                    line_start = 0
+                    while (line_end := buffer.find(b"\n", scan_pos)) != -1:
+                        self._last_file_pos = buffer_file_pos + line_end + 1
+                        parse_line(buffer[line_start:line_end])
+                        line_start = scan_pos = line_end + 1
+
+                    del buffer[:line_start]
+                    buffer_file_pos += line_start
+                    scan_pos = len(buffer)
         finally:
+            self._active_tailers.remove(tailer_token)
             log.info(f"Stopping tailer of journal file {self.path.name} {id(self)=:x}.")
 
     def parse(self) -> None:
-        """Parse the whole journal file and update the fields that were set."""
+        """
+        Parse the whole journal file and update the fields that were set.
+
+        The unparsed rest of the file is read at once, a partially written last line is left for the next parse.
+        The file is not opened if it didn't grow since the last parse.
+        """
+        self._parsed = True
+        if self.path.stat().st_size == self._last_file_pos:
+            return
         log.info(
             f"Statically parsing journal file {self.path.name} from pos {self._last_file_pos}."
         )
-        with self.path.open(encoding="utf8") as journal_file:
+        with self.path.open("rb") as journal_file:
             journal_file.seek(self._last_file_pos)
-            while line := journal_file.readline():
-                self._last_file_pos = journal_file.tell()
-                self._parse_journal_line(line)
-
-    def _parse_journal_line(self, line: str) -> None:
-        """Parse a single line from the journal, setting attributes and emitting signals appropriately."""
-        entry = json.loads(line)
-        if entry["event"] == "Loadout":
-            if self.ship is None:
-                self.ship = Ship()
-            self.ship.update_from_loadout(entry)
-            self.loadout_sig.emit(self.ship)
-
-        elif entry["event"] == "Location" or entry["event"] == "FSDJump":
-            self.location = Location(entry["StarSystem"], *entry["StarPos"])
-            if entry["event"] == "FSDJump":
-                self.system_sig.emit(Location(entry["StarSystem"], *entry["StarPos"]))
-
-        elif entry["event"] == "FSDTarget":
-            self.last_target = Location(
-                entry["Name"], *get_sector_midpoint(entry["SystemAddress"])
-            )
-            self.target_signal.emit(self.last_target)
+            data = journal_file.read()
+
+        parse_line = self._parse_journal_line
+        start_file_pos = self._last_file_pos
+        line_start = 0
+        while (line_end := data.find(b"\n", line_start)) != -1:
+            self._last_file_pos = start_file_pos + line_end + 1
+            parse_line(data[line_start:line_end])
+            line_start = line_end + 1
+
+    def _parse_journal_line(self, line: bytes | bytearray) -> None:
+        """
+        Parse a single line from the journal, setting attributes and emitting signals appropriately.
+
+        Lines that don't contain the name of any handled event are skipped without being decoded.
+        """
+        if self._event_marker_pattern.search(line) is None:
+            return
+        entry = json_loads(line)
+        if (handler := self._event_handlers.get(entry["event"])) is not None:
+            handler(self, entry)
+
+    def _handle_loadout(self, entry: dict) -> None:
+        if self.ship is None:
+            self.ship = Ship()
+        self.ship.update_from_loadout(entry)
+        self.loadout_sig.emit(self.ship)
+
+    def _handle_location(self, entry: dict) -> None:
+        self.location = Location(entry["StarSystem"], *entry["StarPos"])
+
+    def _handle_fsd_jump(self, entry: dict) -> None:
+        self.location = Location(entry["StarSystem"], *entry["StarPos"])
+        self.system_sig.emit(Location(entry["StarSystem"], *entry["StarPos"]))
+
+    def _handle_fsd_target(self, entry: dict) -> None:
+        self.last_target = Location(
+            entry["Name"], *get_sector_midpoint(entry["SystemAddress"])
+        )
+        self.target_signal.emit(self.last_target)
 
-        elif entry["event"] == "Cargo" and entry["Vessel"] == "Ship":
+    def _handle_cargo(self, entry: dict) -> None:
+        if entry["Vessel"] == "Ship":
             self.cargo = entry["Count"]
             self.cargo_signal.emit(self.cargo)
 
-        elif entry["event"] == "Fileheader":
-            self.is_oddysey = entry.get("Odyssey", False)
-
-        elif entry["event"] == "Commander":
-            self.cmdr = entry["Name"]
-
-        elif entry["event"] == "Shutdown":
-            self.shut_down = True
-            self.shut_down_sig.emit()
+    def _handle_file_header(self, entry: dict) -> None:
+        self.is_oddysey = entry.get("Odyssey", False)
+
+    def _handle_commander(self, entry: dict) -> None:
+        self.cmdr = entry["Name"]
+
+    def _handle_shutdown(self, entry: dict) -> None:
+        self.shut_down = True
+        self.shut_down_sig.emit()
+
+    # Journal events we're interested in, mapped to the functions handling them.
+    _event_handlers: t.ClassVar[
+        dict[str, collections.abc.Callable[[Journal, dict], None]]
+    ] = {
+        "Loadout": _handle_loadout,
+        "Location": _handle_location,
+        "FSDJump": _handle_fsd_jump,
+        "FSDTarget": _handle_fsd_target,
+        "Cargo": _handle_cargo,
+        "Fileheader": _handle_file_header,
+        "Commander": _handle_commander,
+        "Shutdown": _handle_shutdown,
+    }
+    _event_marker_pattern: t.ClassVar[re.Pattern[bytes]] = re.compile(
+        b"|".join(re.escape(f'"{event}"'.encode()) for event in _event_handlers)
+    )
 
 
 journal_cache = {}
@@ -127,11 +211,60 @@ def get_cached_journal(path: Path) -> Journal:
     return journal
 
 
+_MAX_LISTED_JOURNALS = 15
+# Same names as the Journal.*.log glob.
+_JOURNAL_NAME_PATTERN = re.compile(r"Journal\..*\.log\Z")
+
+_journal_listing: tuple[int, list[tuple[float, Path]]] | None = None
+
+
+def _get_latest_journal_paths() -> list[tuple[float, Path]]:
+    """
+    Get the creation times and paths of the `_MAX_LISTED_JOURNALS` newest journal files, newest first.
+
+    The listing is reused until the modification time of the journal directory changes.
+    """
+    global _journal_listing
+    dir_mtime = JOURNAL_PATH.stat().st_mtime_ns
+    if _journal_listing is None or _journal_listing[0] != dir_mtime:
+        with os.scandir(JOURNAL_PATH) as entries:
+            latest_entries = heapq.nlargest(
+                _MAX_LISTED_JOURNALS,
+                (
+                    entry
+                    for entry in entries
+                    if _JOURNAL_NAME_PATTERN.match(entry.name) is not None
+                ),
+                key=lambda entry: entry.stat().st_ctime,
+            )
+        _journal_listing = dir_mtime, [
+            (entry.stat().st_ctime, Path(entry.path)) for entry in latest_entries
+        ]
+
+    return _journal_listing[1]
+
+
+def _ends_with_shut_down(path: Path) -> bool:
+    """Check whether the last line of the journal at `path` is a Shutdown event, without reading the rest of it."""
+    with path.open("rb") as journal_file:
+        file_size = journal_file.seek(0, 2)
+        journal_file.seek(max(0, file_size - _SHUT_DOWN_CHECK_SIZE))
+        last_line = journal_file.read().rstrip().rpartition(b"\n")[2]
+
+    if b'"Shutdown"' not in last_line:
+        return False
+    try:
+        return json_loads(last_line)["event"] == "Shutdown"
+    except (ValueError, KeyError):
+        return False
+
+
 def get_unique_cmdr_journals() -> list[Journal]:
     """
     Get the latest journals for each found CMDR.
 
-    Only the first 15 journals newer than a week are looked at.
+    Only the first `_MAX_LISTED_JOURNALS` journals newer than a week are looked at,
+    journals that weren't parsed before and end with a shut down are skipped without being parsed.
     """
     if __debug__:
         week_before = float("-inf")
@@ -140,15 +273,12 @@ def get_unique_cmdr_journals() -> list[Journal]:
             datetime.datetime.now() - datetime.timedelta(weeks=1)
         ).timestamp()
 
-    journal_paths = [
-        path
-        for path in JOURNAL_PATH.glob("Journal.*.log")
-        if path.stat().st_ctime > week_before
-    ]
-    journal_paths.sort(key=lambda path: path.stat().st_ctime, reverse=True)
-
     journals = []
-    for journal_path in journal_paths[:15]:
+    for ctime, journal_path in _get_latest_journal_paths():
+        if ctime <= week_before:
+            break
+        if journal_path not in journal_cache and _ends_with_shut_down(journal_path):
+            continue
         journal = get_cached_journal(journal_path)
         if not journal.shut_down:
             journals.append(journal)
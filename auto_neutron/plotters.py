@@ -64,6 +64,7 @@ class AhkPlotter(Plotter):
         self._used_ahk_path = None
         self._used_hotkey = None
         self._last_system = None
+        self._script_cache: dict[tuple[str, str], str] = {}
         super().__init__(start_system)
 
     def _start_ahk(self) -> None:
@@ -131,11 +132,7 @@ class AhkPlotter(Plotter):
             tempfile.gettempdir(), tempfile.gettempprefix() + "_auto_neutron_script"
         )
         try:
-            temp_path.write_text(
-                AHK_TEMPLATE.substitute(
-                    hotkey=settings.AHK.bind, user_script=settings.AHK.get_script()
-                )
-            )
+            temp_path.write_text(self._get_full_script())
             yield temp_path
         finally:
             try:
@@ -143,3 +140,14 @@ class AhkPlotter(Plotter):
             except OSError:
                 # There probably was an error in AHK and it's still holding the file open.
                 log.warning(f"Unable to delete temp file at {temp_path}.")
+
+    def _get_full_script(self) -> str:
+        """Get the AHK script with the current hotkey and user script substituted into the template."""
+        key = (settings.AHK.bind, settings.AHK.get_script())
+        try:
+            return self._script_cache[key]
+        except KeyError:
+            script = self._script_cache[key] = AHK_TEMPLATE.substitute(
+                hotkey=key[0], user_script=key[1]
+            )
+            return script
@@ -6,6 +6,7 @@ from __future__ import annotations
 import abc
 import csv
 import dataclasses
+import functools
 import itertools
 import logging
 import typing as t
@@ -27,13 +28,18 @@ class SystemEntry(abc.ABC):
     This class must be subclassed by a dataclass.
     """
 
+    __slots__ = ()
+
     csv_header: t.ClassVar[tuple[str, ...]] = None  # type: ignore
     system: str
 
+    def __getitem__(self, key: int) -> object:
+        """Implement index based item access."""
+        return getattr(self, _field_names(type(self))[key])
+
     def __setitem__(self, key: int, value: object) -> None:
         """Implement index based item assignment."""
-        attr_name = dataclasses.fields(self)[key].name
-        setattr(self, attr_name, value)
+        setattr(self, _field_names(type(self))[key], value)
 
     @classmethod
     @abc.abstractmethod
@@ -50,7 +56,13 @@ class SystemEntry(abc.ABC):
         """Create a list of the fields as csv."""
 
 
-@dataclasses.dataclass
+@functools.cache
+def _field_names(dataclass: type[SystemEntry]) -> tuple[str, ...]:
+    """Get the names of `dataclass`'s fields in definition order."""
+    return tuple(field.name for field in dataclasses.fields(dataclass))
+
+
+@dataclasses.dataclass(slots=True)
 class GenericPlotRow(SystemEntry):
     """Plot row of an unknown route or a route with only system names."""
 
@@ -68,7 +80,7 @@ class GenericPlotRow(SystemEntry):
         raise NotImplementedError("Can't create generic plot rows.")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ExactPlotRow(SystemEntry):
     """One row entry of an exact plot from the Spansh Galaxy Plotter."""
 
@@ -82,6 +94,10 @@ class ExactPlotRow(SystemEntry):
         "Neutron Star",
     )
 
+    _json_fields: t.ClassVar = itemgetter(
+        "name", "distance", "distance_to_destination", "must_refuel", "has_neutron"
+    )
+
     system: str
     dist: float
     dist_rem: float
@@ -94,18 +110,19 @@ class ExactPlotRow(SystemEntry):
             row[0],
             round(float(row[1]), 2),
             round(float(row[2]), 2),
-            row[5][0] == "Y",
-            row[6][0] == "Y",
+            row[5][:1] == "Y",
+            row[6][:1] == "Y",
         )
 
     @classmethod
     def from_json(cls, json: dict) -> te.Self:  # noqa: D102
+        system, dist, dist_rem, refuel, neutron_star = cls._json_fields(json)
         return cls(
-            json["name"],
-            round(json["distance"], 2),
-            round(json["distance_to_destination"], 2),
-            bool(json["must_refuel"]),  # Spansh returns 0 or 1
-            json["has_neutron"],
+            system,
+            round(dist, 2),
+            round(dist_rem, 2),
+            bool(refuel),  # Spansh returns 0 or 1
+            neutron_star,
         )
 
     def to_csv(self) -> list:  # noqa: D102
@@ -120,7 +137,7 @@ class ExactPlotRow(SystemEntry):
         ]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NeutronPlotRow(SystemEntry):
     """One row entry of an exact plot from the Spansh Neutron Router."""
 
@@ -132,6 +149,10 @@ class NeutronPlotRow(SystemEntry):
         "Jumps",
     )
 
+    _json_fields: t.ClassVar = itemgetter(
+        "system", "distance_jumped", "distance_left", "jumps"
+    )
+
     system: str
     dist_to_arrival: float
     dist_rem: float
@@ -145,18 +166,14 @@ class NeutronPlotRow(SystemEntry):
 
     @classmethod
     def from_json(cls, json: dict) -> te.Self:  # noqa: D102
-        return cls(
-            json["system"],
-            round(json["distance_jumped"], 2),
-            round(json["distance_left"], 2),
-            json["jumps"],
-        )
+        system, dist_to_arrival, dist_rem, jumps = cls._json_fields(json)
+        return cls(system, round(dist_to_arrival, 2), round(dist_rem, 2), jumps)
 
     def to_csv(self) -> list:  # noqa: D102
         return [self.system, self.dist_to_arrival, self.dist_rem, "", self.jumps]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RoadToRichesRow(SystemEntry):
     """
     One row entry of a road to riches  from the Spansh Road 2 Riches plotter.
@@ -182,6 +199,9 @@ class RoadToRichesRow(SystemEntry):
     total_mapping_value: int
     jumps: int
 
+    _scan_value_getter: t.ClassVar = itemgetter("estimated_scan_value")
+    _mapping_value_getter: t.ClassVar = itemgetter("estimated_mapping_value")
+
     @classmethod
     def from_csv_row(cls, row: list[str]) -> te.Self:  # noqa: D102
         raise NotImplementedError("Can't create RoadToRichesRow from a single csv row.")
@@ -189,17 +209,11 @@ class RoadToRichesRow(SystemEntry):
     @classmethod
     def from_json(cls, json: dict) -> te.Self:  # noqa: D102
         bodies = json["bodies"]
-        total_scan_value = 0
-        total_mapping_value = 0
-        for body in bodies:
-            total_scan_value += body["estimated_scan_value"]
-            total_mapping_value += body["estimated_mapping_value"]
-
         return cls(
             json["name"],
             len(bodies),
-            total_scan_value,
-            total_mapping_value,
+            sum(map(cls._scan_value_getter, bodies)),
+            sum(map(cls._mapping_value_getter, bodies)),
             json["jumps"],
         )
 
@@ -216,6 +230,19 @@ class RoadToRichesRow(SystemEntry):
         ]
 
 
+def _remaining_jump_sums(
+    entries: list[NeutronPlotRow] | list[RoadToRichesRow],
+) -> list[int]:
+    """Get the sum of jumps from every index of `entries` to the end, followed by a 0."""
+    sums = list(
+        itertools.accumulate(
+            reversed(entries), lambda total, entry: total + entry.jumps, initial=0
+        )
+    )
+    sums.reverse()
+    return sums
+
+
 _header_to_row_type: dict[tuple[str, ...], type[SystemEntry]] = {
     type_.csv_header: type_
     for type_ in (GenericPlotRow, NeutronPlotRow, ExactPlotRow, RoadToRichesRow)
@@ -324,7 +351,7 @@ class Route(abc.ABC, t.Generic[RowT]):
         """Get route rows for `row_type` from `reader`."""
         return list(
             more_itertools.unique_justseen(
-                (cls.row_type.from_csv_row(row) for row in filter(None, reader)),
+                map(cls.row_type.from_csv_row, filter(None, reader)),
                 key=attrgetter("system"),
             )
         )
@@ -356,19 +383,22 @@ class NeutronRoute(Route[NeutronPlotRow]):
 
     @classmethod
     def from_json(cls, json_dict: dict) -> NeutronRoute:  # noqa: D102
-        route = [
-            NeutronPlotRow.from_json(system_json)
-            for system_json in json_dict["system_jumps"]
-        ]
-        return NeutronRoute(route)
+        return NeutronRoute(
+            list(map(NeutronPlotRow.from_json, json_dict["system_jumps"]))
+        )
+
+    def update_indices(self) -> None:
+        """Update system indices used in `system_index`, and the cached jump counts."""
+        super().update_indices()
+        self._remaining_jump_sums = _remaining_jump_sums(self.entries)
 
     @property
     def total_jumps(self) -> int:  # noqa: D102
-        return sum(entry.jumps for entry in self.entries)
+        return self._remaining_jump_sums[0]
 
     @property
     def remaining_jumps(self) -> int:  # noqa: D102
-        return sum(entry.jumps for entry in self.entries[self.index :])
+        return self._remaining_jump_sums[self.index]
 
 
 class ExactRoute(Route[ExactPlotRow]):
@@ -376,10 +406,7 @@ class ExactRoute(Route[ExactPlotRow]):
 
     @classmethod
     def from_json(cls, json_dict: dict) -> ExactRoute:  # noqa: D102
-        route = [
-            ExactPlotRow.from_json(system_json) for system_json in json_dict["jumps"]
-        ]
-        return ExactRoute(route)
+        return ExactRoute(list(map(ExactPlotRow.from_json, json_dict["jumps"])))
 
 
 class RoadToRichesRoute(Route[RoadToRichesRow]):
@@ -422,10 +449,15 @@ class RoadToRichesRoute(Route[RoadToRichesRow]):
         route = [RoadToRichesRow.from_json(system_json) for system_json in json_dict]
         return RoadToRichesRoute(route)
 
+    def update_indices(self) -> None:
+        """Update system indices used in `system_index`, and the cached jump counts."""
+        super().update_indices()
+        self._remaining_jump_sums = _remaining_jump_sums(self.entries)
+
     @property
     def total_jumps(self) -> int:  # noqa: D102
-        return sum(entry.jumps for entry in self.entries)
+        return self._remaining_jump_sums[0]
 
     @property
     def remaining_jumps(self) -> int:  # noqa: D102
-        return sum(entry.jumps for entry in self.entries[self.index :])
+        return self._remaining_jump_sums[self.index]
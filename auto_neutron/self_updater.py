@@ -23,6 +23,7 @@ import logging
 import shutil
 import subprocess
 import sys
+import tempfile
 import typing as t
 from functools import partial
 from pathlib import Path
@@ -170,17 +171,31 @@ class Updater(QtCore.QObject):
         else:
             download_url = asset_json["browser_download_url"]
             log.info(f"Downloading release from {download_url}.")
-            self._download_started.emit(
-                make_network_request(
-                    download_url,
-                    finished_callback=partial(self._create_new_and_restart),
-                )
+            download_file = tempfile.TemporaryFile()
+            reply = make_network_request(
+                download_url,
+                finished_callback=partial(
+                    self._create_new_and_restart, download_file=download_file
+                ),
+            )
+            reply.readyRead.connect(
+                partial(self._write_reply_data, reply, download_file)
             )
+            self._download_started.emit(reply)
+
+    @staticmethod
+    def _write_reply_data(reply: QtNetwork.QNetworkReply, file: t.BinaryIO) -> None:
+        """Write the data currently available in `reply` to `file`."""
+        file.write(reply.read_all().data())
 
-    def _create_new_and_restart(self, reply: QtNetwork.QNetworkReply) -> None:
+    def _create_new_and_restart(
+        self, reply: QtNetwork.QNetworkReply, download_file: t.BinaryIO
+    ) -> None:
         """
         Create the new executable/directory from the reply data and start it.
 
+        The reply's data is streamed into `download_file` as it arrives, the file is closed after it's used.
+
         In the one directory move, the current contents of this directory are moved to the `TEMP_NAME` directory next
         to it, and the new contents are unpacked into the original.
 
@@ -191,27 +206,43 @@ class Updater(QtCore.QObject):
         """
         try:
             if reply.error() is QtNetwork.QNetworkReply.NetworkError.NoError:
-                download_bytes = reply.read_all().data()
+                self._write_reply_data(reply, download_file)
+                download_file.seek(0)
             elif (
                 reply.error()
                 is QtNetwork.QNetworkReply.NetworkError.OperationCanceledError
             ):
+                download_file.close()
                 return
             else:
+                download_file.close()
                 self._show_error_window(reply.error_string())
                 return
         finally:
             reply.delete_later()
 
+        with download_file:
+            if not self._replace_with_release(download_file):
+                return
+
+        subprocess.Popen(str(EXECUTABLE_PATH))
+        get_application().exit()
+
+    def _replace_with_release(self, download_file: t.BinaryIO) -> bool:
+        """
+        Replace the running executable/directory with the release in `download_file`.
+
+        Return True if the new release is in place, otherwise show the error window and return False.
+        """
         if IS_ONEFILE:
             try:
-                SignedPEFile(io.BytesIO(download_bytes)).verify()
+                SignedPEFile(download_file).verify()
             except SignifyError as e:
                 log.warning("Invalid file signature", exc_info=e)
                 self._show_error_window(
                     _("Unable to verify downloaded file signature: " + str(e))
                 )
-                return
+                return False
 
             temp_path = EXECUTABLE_PATH.with_stem(TEMP_NAME)
             try:
@@ -219,16 +250,18 @@ class Updater(QtCore.QObject):
             except OSError as e:
                 log.warning("Failed to rename executable.", exc_info=e)
                 self._show_error_window(_("Unable to rename executable: ") + str(e))
-                return
+                return False
             try:
-                Path(EXECUTABLE_PATH).write_bytes(download_bytes)
+                download_file.seek(0)
+                with EXECUTABLE_PATH.open("wb") as executable_file:
+                    shutil.copyfileobj(download_file, executable_file)
             except OSError as e:
                 log.warning("Failed to write new executable.", exc_info=e)
                 self._show_error_window(_("Unable to create new executable: ") + str(e))
-                return
+                return False
 
         else:
-            zip_file = ZipFile(io.BytesIO(download_bytes))
+            zip_file = ZipFile(download_file)
             for file in zip_file.namelist():
                 if Path(file).suffix in {".exe", ".dll", ".pyd"}:
                     try:
@@ -240,7 +273,7 @@ class Updater(QtCore.QObject):
                                 "Unable to verify downloaded file signature for file {}: {}"
                             ).format(file, str(e))
                         )
-                        return
+                        return False
 
             dir_path = EXECUTABLE_PATH.parent
             temp_path = dir_path / TEMP_NAME
@@ -252,17 +285,23 @@ class Updater(QtCore.QObject):
                 self._show_error_window(
                     _("Unable to create temporary directory: ") + str(e)
                 )
-                return
+                return False
 
-            for file in dir_path.glob("*"):
+            for file in dir_path.iterdir():
+                if file == temp_path:
+                    continue
                 try:
-                    shutil.move(file, temp_path)
+                    try:
+                        # Plain rename within the directory, shutil.move only when that fails.
+                        file.rename(temp_path / file.name)
+                    except OSError:
+                        shutil.move(file, temp_path)
                 except OSError as e:
                     log.warning("Failed to move files to temp directory.", exc_info=e)
                     self._show_error_window(
                         _("Unable to move files into temporary directory: ") + str(e)
                     )
-                    return
+                    return False
 
             try:
                 zip_file.extractall(path=dir_path)
@@ -271,7 +310,6 @@ class Updater(QtCore.QObject):
                 self._show_error_window(
                     _("Unable to extract new release files: ") + str(e)
                 )
-                return
+                return False
 
-        subprocess.Popen(str(EXECUTABLE_PATH))
-        get_application().exit()
+        return True
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from auto_neutron.fsd import FrameShiftDrive
 
 _BOOSTER_NAME_TO_RANGE = {
@@ -24,15 +26,50 @@ class Ship:
         self.reserve_size: float | None = None
         self.unladen_mass: float | None = None
         self.max_cargo: int | None = None
+        self._jump_ranges: dict[int, float] = {}
 
     def jump_range(self, *, cargo_mass: int) -> float:
-        """Calculate the jump range with `cargo_mass` t of cargo."""
-        return (
-            self.fsd.optimal_mass
-            * (1000 * self.fsd.max_fuel_usage / self.fsd.rating_const)
-            ** (1 / self.fsd.size_const)
-            / (self.unladen_mass + self.tank_size + self.reserve_size + cargo_mass)
-        ) + self.jump_range_boost
+        """
+        Calculate the jump range with `cargo_mass` t of cargo.
+
+        Calculated ranges are kept until the ship is updated.
+        """
+        try:
+            return self._jump_ranges[cargo_mass]
+        except KeyError:
+            jump_range = self._jump_ranges[cargo_mass] = (
+                self._jump_range_mass_factor
+                / (self.unladen_mass + self.tank_size + self.reserve_size + cargo_mass)
+                + self.jump_range_boost
+            )
+            return jump_range
+
+    @functools.cached_property
+    def _jump_range_mass_factor(self) -> float:
+        """Get the part of the jump range formula that doesn't depend on the ship's mass."""
+        return self.fsd.optimal_mass * (
+            1000 * self.fsd.max_fuel_usage / self.fsd.rating_const
+        ) ** (1 / self.fsd.size_const)
+
+    @functools.cached_property
+    def spansh_exact_params(self) -> dict[str, float]:
+        """Get the ship's parameters for the Spansh galaxy plotter, kept until the ship is updated."""
+        return {
+            "fuel_power": self.fsd.size_const,
+            "fuel_multiplier": self.fsd.rating_const / 1000,
+            "optimal_mass": self.fsd.optimal_mass,
+            "base_mass": self.unladen_mass + self.reserve_size,
+            "tank_size": self.tank_size,
+            "internal_tank_size": self.reserve_size,
+            "max_fuel_per_jump": self.fsd.max_fuel_usage,
+            "range_boost": self.jump_range_boost,
+        }
+
+    def _clear_cached_stats(self) -> None:
+        """Clear values calculated from the ship's stats."""
+        self._jump_ranges.clear()
+        self.__dict__.pop("spansh_exact_params", None)
+        self.__dict__.pop("_jump_range_mass_factor", None)
 
     # region: loadout
     @classmethod
@@ -50,6 +87,7 @@ class Ship:
         self.tank_size = int(loadout_dict["FuelCapacity"]["Main"])
         self.reserve_size = loadout_dict["FuelCapacity"]["Reserve"]
         self.max_cargo = loadout_dict["CargoCapacity"]
+        self._clear_cached_stats()
 
     @staticmethod
     def _fsd_boost_from_loadout_dict(loadout: dict) -> float:
@@ -77,6 +115,7 @@ class Ship:
         self.tank_size = coriolis_json["stats"]["fuelCapacity"]
         self.reserve_size = coriolis_json["stats"]["reserveFuelCapacity"]
         self.max_cargo = coriolis_json["stats"]["cargoCapacity"]
+        self._clear_cached_stats()
 
     @staticmethod
     def _fsd_boost_from_coriolis_json(json_data: dict) -> float:
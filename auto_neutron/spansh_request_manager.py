@@ -5,6 +5,8 @@ from __future__ import annotations
 
 import collections.abc
 import logging
+import math
+import time
 import typing as t
 from functools import partial
 
@@ -21,15 +23,22 @@ from auto_neutron.utils.network import (
 
 log = logging.getLogger(__name__)
 
+# Minimum number of seconds between two requests sent to Spansh.
+_MIN_REQUEST_INTERVAL = 1
+
 
 class SpanshRequestManager:
     """Track the current reply from Spansh to allow termination."""
 
     def __init__(self, parent: QtCore.QObject):
         self._current_reply = None
+        self._delayed_request: (
+            collections.abc.Callable[[], QtNetwork.QNetworkReply] | None
+        ) = None
+        self._last_request_time = -math.inf
         self._delay_timer = QtCore.QTimer(parent)
         self._delay_timer.single_shot_ = True
-        self._timer_connection = None
+        self._delay_timer.timeout.connect(self._make_delayed_request)
 
     def _reply_callback(
         self,
@@ -71,10 +80,9 @@ class SpanshRequestManager:
             if job_response.get("status") == "queued":
                 sec_delay = next(delay_iterator)
                 log.debug(f"Re-requesting queued job result in {sec_delay} seconds.")
-                self._delay_timer.interval = 2000
-                self._timer_connection = self._delay_timer.timeout.connect(
+                self._schedule_request(
                     partial(
-                        self.make_request,
+                        make_network_request,
                         SPANSH_API_URL + "/results/" + job_response["job"],
                         finished_callback=partial(
                             self._reply_callback,
@@ -84,8 +92,8 @@ class SpanshRequestManager:
                             result_decode_func=result_decode_func,
                         ),
                     ),
+                    2,
                 )
-                self._delay_timer.start()
             elif job_response.get("result") is not None:
                 log.debug("Received finished neutron job.")
                 result_callback(result_decode_func(job_response["result"]))
@@ -102,19 +110,54 @@ class SpanshRequestManager:
         self._reply_callback(*args, **kwargs, result_decode_func=route_type.from_json)
 
     def make_request(self, *args: t.Any, **kwargs: t.Any) -> None:
-        """Make a network request and store the result reply."""
+        """
+        Make a network request and store the result reply.
+
+        If the previous request was sent less than `_MIN_REQUEST_INTERVAL` seconds ago,
+        the request is delayed until the interval passes.
+        """
         self.abort()
-        self._current_reply = make_network_request(*args, **kwargs)
+        self._schedule_request(partial(make_network_request, *args, **kwargs), 0)
 
     def abort(self) -> None:
         """Abort the current request."""
         if self._current_reply is not None:
             log.debug("Aborting route plot request.")
             self._current_reply.abort()
+        self._delayed_request = None
         self._delay_timer.stop()
 
+    def _schedule_request(
+        self,
+        request: collections.abc.Callable[[], QtNetwork.QNetworkReply],
+        delay: float,
+    ) -> None:
+        """Send `request` after `delay` seconds, or later if needed to keep the minimum interval between requests."""
+        delay = max(
+            delay, self._last_request_time + _MIN_REQUEST_INTERVAL - time.monotonic()
+        )
+        if delay > 0:
+            self._delayed_request = request
+            self._delay_timer.interval = math.ceil(delay * 1000)
+            self._delay_timer.start()
+        else:
+            self._send_request(request)
+
+    def _send_request(
+        self, request: collections.abc.Callable[[], QtNetwork.QNetworkReply]
+    ) -> None:
+        """Send `request` and store its reply."""
+        self._last_request_time = time.monotonic()
+        self._current_reply = request()
+
+    def _make_delayed_request(self) -> None:
+        """Make the request scheduled to be made after the delay timer's timeout."""
+        request = self._delayed_request
+        self._delayed_request = None
+        self._send_request(request)
+
     def _reset_reply(self) -> None:
-        """Reset the reply and disconnect the timer from the old make_request."""
+        """Reset the reply and the request scheduled with the delay timer."""
         self._current_reply = None
-        if self._timer_connection is not None:
-            self._delay_timer.disconnect(self._timer_connection)
+        self._delayed_request = None
+        self._delay_timer.stop()
@@ -14,6 +14,7 @@ from __feature__ import snake_case, true_property  # noqa: F401
 
 import auto_neutron
 from auto_neutron.constants import APP, VERSION
+from auto_neutron.utils.utils import json_loads
 
 if t.TYPE_CHECKING:
     import collections.abc
@@ -36,22 +37,38 @@ class NetworkError(Exception):
         super().__init__(qt_error, reply_error)
 
 
+def _create_request_template(*, json_body: bool = False) -> QtNetwork.QNetworkRequest:
+    """Create a request with the headers shared by all requests made with it."""
+    request = QtNetwork.QNetworkRequest()
+    request.set_header(
+        QtNetwork.QNetworkRequest.KnownHeaders.UserAgentHeader, f"{APP}/{VERSION}"
+    )
+    if json_body:
+        request.set_header(
+            QtNetwork.QNetworkRequest.KnownHeaders.ContentTypeHeader,
+            "application/json",
+        )
+    return request
+
+
+# The access manager copies the request when it's sent,
+# so only the url needs to be changed on a shared request for every new one.
+_get_request = _create_request_template()
+_post_request = _create_request_template(json_body=True)
+
+
 def make_network_request(
     url: str,
     *,
-    params: collections.abc.Mapping = {},  # noqa: B006
+    params: collections.abc.Mapping | None = None,
     finished_callback: collections.abc.Callable[[QtNetwork.QNetworkReply], t.Any],
 ) -> QtNetwork.QNetworkReply:
     """Make a network request to `url` with a `params` query and connect its reply to `finished_callback`."""
     log.debug(f"Sending request to {url} with {params=}")
     if params:
         url += "?" + urllib.parse.urlencode(params)
-    qurl = QtCore.QUrl(url)
-    request = QtNetwork.QNetworkRequest(qurl)
-    request.set_header(
-        QtNetwork.QNetworkRequest.KnownHeaders.UserAgentHeader, f"{APP}/{VERSION}"
-    )
-    reply = auto_neutron.network_mgr.get(request)
+    _get_request.set_url(QtCore.QUrl(url))
+    reply = auto_neutron.network_mgr.get(_get_request)
     reply.finished.connect(partial(finished_callback, reply))
 
     return reply
@@ -60,21 +77,14 @@ def make_network_request(
 def post_request(
     url: str,
     *,
-    json_: collections.abc.Mapping = {},  # noqa: B006
+    json_: collections.abc.Mapping | None = None,
     finished_callback: collections.abc.Callable[[QtNetwork.QNetworkReply], t.Any],
 ) -> QtNetwork.QNetworkReply:
     """Make a post request to `url` with `json_` as its body. Connect its reply to `finished_callback`."""
-    qurl = QtCore.QUrl(url)
-    request = QtNetwork.QNetworkRequest(qurl)
-    request.set_header(
-        QtNetwork.QNetworkRequest.KnownHeaders.UserAgentHeader, f"{APP}/{VERSION}"
-    )
-    request.set_header(
-        QtNetwork.QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/json"
-    )
+    _post_request.set_url(QtCore.QUrl(url))
     reply = auto_neutron.network_mgr.post(
-        request,
-        json.dumps(json_).encode(),
+        _post_request,
+        json.dumps(json_ if json_ is not None else {}).encode(),
     )
     reply.finished.connect(partial(finished_callback, reply))
 
@@ -86,23 +96,21 @@ def json_from_network_req(
 ) -> dict:
     """Decode bytes from the `QNetworkReply` object or raise an error on failed requests."""
     try:
-        if reply.error() is QtNetwork.QNetworkReply.NetworkError.NoError:
-            return json.loads(reply.read_all().data())
+        error = reply.error()
+        if error is QtNetwork.QNetworkReply.NetworkError.OperationCanceledError:
+            raise NetworkError(error, reply.error_string(), None)
 
-        elif (
-            reply.error() is QtNetwork.QNetworkReply.NetworkError.OperationCanceledError
-        ):
-            raise NetworkError(reply.error(), reply.error_string(), None)
+        response = reply.read_all().data()
+        if error is QtNetwork.QNetworkReply.NetworkError.NoError:
+            return json_loads(response)
 
-        else:
-            text_response = reply.read_all().data()
-            if text_response:
-                if json_error_key is not None:
-                    reply_error = json.loads(text_response)[json_error_key]
-                else:
-                    reply_error = text_response
+        if response:
+            if json_error_key is not None:
+                reply_error = json_loads(response)[json_error_key]
             else:
-                reply_error = None
-            raise NetworkError(reply.error(), reply.error_string(), reply_error)
+                reply_error = response
+        else:
+            reply_error = None
+        raise NetworkError(error, reply.error_string(), reply_error)
     finally:
         reply.delete_later()
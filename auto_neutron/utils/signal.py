@@ -42,3 +42,19 @@ class ReconnectingSignal:
         yield
         self._depth -= 1
         self.connect()
+
+    @staticmethod
+    @contextmanager
+    def temporarily_disconnect_all(
+        signals: collections.abc.Collection[ReconnectingSignal],
+    ) -> collections.abc.Iterator[None]:
+        """Disconnect all `signals` for the duration of the context manager, then reconnect them."""
+        for signal in signals:
+            signal.disconnect()
+            signal._depth += 1
+        try:
+            yield
+        finally:
+            for signal in signals:
+                signal._depth -= 1
+                signal.connect()
@@ -11,6 +11,11 @@ import typing as t
 from PySide6 import QtCore, QtWidgets
 from __feature__ import snake_case, true_property  # noqa: F401
 
+try:
+    from orjson import loads as json_loads  # noqa: F401
+except ImportError:
+    from json import loads as json_loads  # noqa: F401
+
 if t.TYPE_CHECKING:
     import collections.abc
     from types import TracebackType
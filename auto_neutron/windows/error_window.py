@@ -35,6 +35,15 @@ class ErrorWindow(ErrorWindowGUI):
 
     def __init__(self, parent: QtWidgets.QWidget):
         self._num_errors = 0
+        # Logging is configured before any window is created, so the handler can be looked up once.
+        self._file_handler = next(
+            (
+                handler
+                for handler in root_logger.handlers
+                if isinstance(handler, logging.FileHandler)
+            ),
+            None,
+        )
         super().__init__(parent)
         self.quit_button.pressed.connect(get_application().quit)
         self.send_log.pressed.connect(self._send_error_report)
@@ -101,15 +110,7 @@ class ErrorWindow(ErrorWindowGUI):
 
     def _get_log_file_name(self) -> Path | None:
         """Get the file name of the current active file logger, or None if none are used."""
-        handler = next(
-            (
-                handler
-                for handler in root_logger.handlers
-                if isinstance(handler, logging.FileHandler)
-            ),
-            None,
-        )
-
+        handler = self._file_handler
         if handler is not None:
             return Path(get_file_name(handler.stream))
         else:
@@ -6,6 +6,8 @@ from __future__ import annotations
 from PySide6 import QtCore, QtGui, QtWidgets
 from __feature__ import snake_case, true_property  # noqa: F401
 
+_CHECKBOX_BACKGROUND_COLOR = QtGui.QColor(100, 100, 0, 0)
+
 
 class SpinBoxDelegate(QtWidgets.QStyledItemDelegate):
     """Item delegate for a table to use cells as `SpinBox`es."""
@@ -100,10 +102,10 @@ class CheckBoxDelegate(QtWidgets.QStyledItemDelegate):
             )
 
         check_box_style_option.palette.set_color(
-            QtGui.QPalette.ColorRole.Window, QtGui.QColor(100, 100, 0, 0)
+            QtGui.QPalette.ColorRole.Window, _CHECKBOX_BACKGROUND_COLOR
         )
         check_box_style_option.palette.set_color(
-            QtGui.QPalette.ColorRole.Base, QtGui.QColor(100, 100, 0, 0)
+            QtGui.QPalette.ColorRole.Base, _CHECKBOX_BACKGROUND_COLOR
         )
 
         QtWidgets.QApplication.style().draw_control(
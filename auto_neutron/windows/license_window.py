@@ -67,6 +67,9 @@ class LicenseWindow(LicenseWindowGUI):
         more_itertools_license_url = (
             base_path() / "third_party_licenses/LICENSE_more-itertools.md"
         ).as_uri()
+        orjson_license_url = (
+            base_path() / "third_party_licenses/LICENSE_orjson.md"
+        ).as_uri()
         auto_neutron_license_url = (base_path() / "LICENSE.md").as_uri()
 
         return textwrap.dedent(
@@ -83,6 +86,7 @@ class LicenseWindow(LicenseWindowGUI):
         - Qt6, click the "About Qt" button for more details.
         - tomli-w licensed under the {tomli_w_hyperlink}
         - more-itertools licensed under the {more_itertools_hyperlink}
+        - orjson licensed under the {orjson_hyperlink}
         - babel licensed under the {babel_hyperlink}
         - Python and its associated software:
 
@@ -114,6 +118,7 @@ class LicenseWindow(LicenseWindowGUI):
             more_itertools_hyperlink=self.make_hyperlink(
                 _("MIT license"), more_itertools_license_url
             ),
+            orjson_hyperlink=self.make_hyperlink(_("MIT license"), orjson_license_url),
             babel_hyperlink=self.make_hyperlink(
                 _("3-Clause BSD license"), babel_license_url
             ),
@@ -3,40 +3,41 @@
 
 from __future__ import annotations
 
-import dataclasses
 import time
 import typing as t
 
-from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6 import QtCore, QtGui
 from __feature__ import snake_case, true_property  # noqa: F401
 
 from auto_neutron import settings
-from auto_neutron.utils.signal import ReconnectingSignal
 
 from ..utils.utils import get_application
 from .gui.main_window import MainWindowGUI
 from .route_table_header import RouteTableHeader, header_from_row_type
 
 if t.TYPE_CHECKING:
-    import collections.abc
-
     from auto_neutron.route import Route
 
 
+def _cell_text(value: object) -> str:
+    """Convert the table cell `value` to text the same way Qt does for its display."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
 class MainWindow(MainWindowGUI):
     """Wrap the GUI and add functional behaviour to it."""
 
     def __init__(self):
         super().__init__()
         self.change_action.triggered.connect(
-            lambda: self.table.edit_item(self.table.current_item())
+            lambda: self.table.edit(self.table.current_index())
         )
         self.copy_action.triggered.connect(self.copy_table_item_text)
-        self.resize_connection = ReconnectingSignal(
-            self.table.itemChanged,
-            self.manage_item_changed,
-        )
-        self.resize_connection.connect()
+        self.table_model.item_edited.connect(self.manage_item_changed)
 
         self.table.vertical_scroll_bar().install_event_filter(self)
         self._last_scroll_time = float("-inf")
@@ -52,38 +53,31 @@ class MainWindow(MainWindowGUI):
     @QtCore.Slot()
     def copy_table_item_text(self) -> None:
         """Copy the text of the selected table item into the clipboard."""
-        if (item := self.table.current_item()) is not None:
-            get_application().clipboard().set_text(item.text())
-
-    def mass_insert(
-        self, data: collections.abc.Iterable[collections.abc.Iterable[t.Any]]
-    ) -> None:
-        """Insert a rows from `data`, then resize columns and rows to contents."""
-        with self.resize_connection.temporarily_disconnect():
-            for row in data:
-                self.insert_row(row)
-        self.table.resize_columns_to_contents()
-        self.table.resize_rows_to_contents()
+        if (index := self.table.current_index()).is_valid():
+            get_application().clipboard().set_text(_cell_text(index.data()))
 
     def initialize_table(self, route: Route) -> None:
-        """Clear the table and insert plot rows from `Route` into it with appropriate columns."""
+        """Display the plot rows from `Route` in the table with appropriate columns."""
         self._route = route
 
-        self.table.clear()
-        self.table.row_count = 0
-
         self._header_type = header = header_from_row_type(route.row_type)(self.table)
+        self.table_model.set_entries(route.entries, header.column_count)
         header.initialize_headers()
         header.retranslate_headers()
 
-        self.mass_insert(dataclasses.astuple(row) for row in route.entries)
+        self.table.resize_columns_to_contents()
+        if route.entries:
+            # All rows hold a single line of text in the same font,
+            # so the first one can be measured in place of every row.
+            self.table.vertical_header().default_section_size = (
+                self.table.size_hint_for_row(0)
+            )
         self.update_remaining_count()
 
     def set_current_row(self, index: int) -> None:
         """Change the item colours before `index` to appear inactive and update the remaining systems/jump."""
-        with self.resize_connection.temporarily_disconnect():
-            super().inactivate_before_index(index)
-            self.update_remaining_count()
+        self.table_model.inactivate_before_index(index)
+        self.update_remaining_count()
 
         if settings.Window.autoscroll and time.monotonic() - self._last_scroll_time > 1:
             self.scroll_to_index(index)
@@ -97,16 +91,20 @@ class MainWindow(MainWindowGUI):
         For exact plot routes the count is displayed next to the system name header,
         for neutron plot routes it's in the jump header.
         """
-        with self.resize_connection.temporarily_disconnect():
-            self._header_type.set_jumps(
-                remaining=self._route.remaining_jumps, total=self._route.total_jumps
-            )
-            self._header_type.format_jump_header()
+        self._header_type.set_jumps(
+            remaining=self._route.remaining_jumps, total=self._route.total_jumps
+        )
+        self._header_type.format_jump_header()
+
+    def reset_column_widths(self) -> None:
+        """Refit the table's columns after their contents' size changed, e.g. on a font change."""
+        if self._header_type is not None:
+            self._header_type.reset_column_widths()
 
-    @QtCore.Slot(QtWidgets.QTableWidgetItem)
-    def manage_item_changed(self, table_item: QtWidgets.QTableWidgetItem) -> None:
+    @QtCore.Slot(QtCore.QModelIndex)
+    def manage_item_changed(self, index: QtCore.QModelIndex) -> None:
         """Update the column sizes and information when an item is changed."""
-        self._header_type.item_changed(table_item)
+        self._header_type.item_changed(index)
 
     def restore_window(self) -> None:
         """Restore the size and position from the settings."""
@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import collections.abc
-import contextlib
 import datetime
 import logging
 from functools import partial
@@ -78,6 +77,7 @@ class NewRouteWindow(NewRouteWindowGUI):
         self._journal_worker: GameWorker | None = None
 
         self.combo_signals = list[ReconnectingSignal]()
+        self._hidden = False
         self._source_sync_signals = list[ReconnectingSignal]()
         self._destination_sync_signals = list[ReconnectingSignal]()
 
@@ -133,21 +133,19 @@ class NewRouteWindow(NewRouteWindowGUI):
     @QtCore.Slot(int)
     def _sync_journal_combos(self, index: int) -> None:
         """Assign all journal combo boxes to display the item at `index`."""
-        exit_stack = contextlib.ExitStack()
-        with exit_stack:
-            for signal in self.combo_signals:
-                exit_stack.enter_context(signal.temporarily_disconnect())
-            for tab in self.tabs:
-                tab.journal_combo.current_index = index
+        if self._hidden:
+            return
+        for tab in self.tabs:
+            combo = tab.journal_combo
+            if combo.current_index != index:
+                with QtCore.QSignalBlocker(combo):
+                    combo.current_index = index
         self._change_journal(index)
 
     @QtCore.Slot(str)
     def _sync_source_line_edits(self, text: str) -> None:
         """Sync all source line edits of Spansh tabs."""
-        exit_stack = contextlib.ExitStack()
-        with exit_stack:
-            for signal in self._source_sync_signals:
-                exit_stack.enter_context(signal.temporarily_disconnect())
+        with ReconnectingSignal.temporarily_disconnect_all(self._source_sync_signals):
             for tab in self.tabs:
                 if isinstance(tab, SpanshTabBase) and (
                     not tab.source_edit.modified or not tab.source_edit.text
@@ -157,10 +155,9 @@ class NewRouteWindow(NewRouteWindowGUI):
     @QtCore.Slot(str)
     def _sync_destination_line_edits(self, text: str) -> None:
         """Sync all destination line edits of Spansh tabs."""
-        exit_stack = contextlib.ExitStack()
-        with exit_stack:
-            for signal in self._destination_sync_signals:
-                exit_stack.enter_context(signal.temporarily_disconnect())
+        with ReconnectingSignal.temporarily_disconnect_all(
+            self._destination_sync_signals
+        ):
             for tab in self.tabs:
                 if isinstance(tab, SpanshTabBase) and (
                     not tab.target_edit.modified or not tab.target_edit.text
@@ -187,10 +184,7 @@ class NewRouteWindow(NewRouteWindowGUI):
                 )
             )
 
-        with contextlib.ExitStack() as exit_stack:
-            for signal in self.combo_signals:
-                exit_stack.enter_context(signal.temporarily_disconnect())
-
+        with ReconnectingSignal.temporarily_disconnect_all(self.combo_signals):
             for tab in self.tabs:
                 tab.journal_combo.clear()
 
@@ -215,6 +209,8 @@ class NewRouteWindow(NewRouteWindowGUI):
 
     def _change_journal(self, index: int, *, show_change_message: bool = True) -> None:
         """Change the current journal and update the UI with its data, or display an error if shut down."""
+        if self._hidden:
+            return
         journal = self._journals[index]
         log.info(f"Changing selected journal to index {index} ({journal.path.name}).")
 
@@ -278,6 +274,16 @@ class NewRouteWindow(NewRouteWindowGUI):
         for tab in tabs:
             tab.delete_later()
 
+    def hide_event(self, event: QtGui.QHideEvent) -> None:
+        """Ignore journal combo changes while the window is hidden."""
+        self._hidden = True
+        super().hide_event(event)
+
+    def show_event(self, event: QtGui.QShowEvent) -> None:
+        """Handle journal combo changes again once the window is shown."""
+        self._hidden = False
+        super().show_event(event)
+
     def close_event(self, event: QtGui.QCloseEvent) -> None:
         """Abort any running network request on close."""
         self._request_manager.abort()
@@ -286,8 +292,5 @@ class NewRouteWindow(NewRouteWindowGUI):
 
     def retranslate(self) -> None:
         """Retranslate text that is always on display."""
-        exit_stack = contextlib.ExitStack()
-        with exit_stack:
-            for signal in self.combo_signals:
-                exit_stack.enter_context(signal.temporarily_disconnect())
+        with ReconnectingSignal.temporarily_disconnect_all(self.combo_signals):
             super().retranslate()
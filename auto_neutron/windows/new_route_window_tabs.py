@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import collections.abc
 import csv
-import json
 import logging
 import typing as t
 import weakref
@@ -32,6 +31,7 @@ from auto_neutron.utils.utils import (
     create_request_delay_iterator,
     get_application,
     intern_list,
+    json_loads,
 )
 from auto_neutron.windows import NearestWindow
 from auto_neutron.windows.gui.new_route_window import (
@@ -276,8 +276,14 @@ class SpanshTabBase(TabBase, SpanshTabGUIBase):
         self._request_manager: SpanshRequestManager | None = None
         self._connections = list[QtCore.QMetaObject.Connection]()
         self.nearest_button.pressed.connect(self._display_nearest_window)
-        self.source_edit.textChanged.connect(self._set_submit_sensitive)
-        self.target_edit.textChanged.connect(self._set_submit_sensitive)
+
+        # Coalesce the text changes from typing or pasting into a single update when control returns to the event loop.
+        self._submit_sensitive_timer = QtCore.QTimer(self)
+        self._submit_sensitive_timer.single_shot_ = True
+        self._submit_sensitive_timer.interval = 0
+        self._submit_sensitive_timer.timeout.connect(self._set_submit_sensitive)
+        self.source_edit.textChanged.connect(self._submit_sensitive_timer.start)
+        self.target_edit.textChanged.connect(self._submit_sensitive_timer.start)
 
         self._source_completer_model = QtCore.QStringListModel(self)
         self.source_completer = QtWidgets.QCompleter(self._source_completer_model, self)
@@ -288,6 +294,7 @@ class SpanshTabBase(TabBase, SpanshTabGUIBase):
         self._setup_completer(self.target_completer, line_edit=self.target_edit)
 
         self._completer_request: QtNetwork.QNetworkReply | None = None
+        self._nearest_window: NearestWindow | None = None
         self._completer_cache = self._completer_caches.setdefault(
             self.parent(), DictWeakref()
         )
@@ -382,29 +389,41 @@ class SpanshTabBase(TabBase, SpanshTabGUIBase):
         )
         if window is None:
             return
+        self._nearest_window = window
 
-        def set_modified(widget: QtWidgets.QLineEdit, *args) -> None:
-            widget.modified = True
-
-        window.copy_source.connect(partial(setattr, self.source_edit, "text"))
-        window.copy_source.connect(partial(set_modified, self.source_edit))
+        window.copy_source.connect(self._set_source_from_nearest)
+        window.copy_destination.connect(self._set_target_from_nearest)
+        window.from_target_button.pressed.connect(self._set_nearest_input_from_target)
+        window.from_location_button.pressed.connect(
+            self._set_nearest_input_from_location
+        )
+        window.show()
 
-        window.copy_destination.connect(partial(setattr, self.target_edit, "text"))
-        window.copy_destination.connect(partial(set_modified, self.target_edit))
+    @QtCore.Slot(str)
+    def _set_source_from_nearest(self, system: str) -> None:
+        """Set the source to `system` from the nearest window, and mark it as modified by the user."""
+        self.source_edit.text = system
+        self.source_edit.modified = True
 
-        @QtCore.Slot()
-        def set_input_from_target() -> None:
-            if self._journal is not None:
-                window.set_input_values_from_location(self._journal.last_target)
+    @QtCore.Slot(str)
+    def _set_target_from_nearest(self, system: str) -> None:
+        """Set the target to `system` from the nearest window, and mark it as modified by the user."""
+        self.target_edit.text = system
+        self.target_edit.modified = True
 
-        @QtCore.Slot()
-        def set_input_from_location() -> None:
-            if self._journal is not None:
-                window.set_input_values_from_location(self._journal.location)
+    @QtCore.Slot()
+    def _set_nearest_input_from_target(self) -> None:
+        """Set the nearest window's coordinates from the journal's last target."""
+        if self._journal is not None:
+            self._nearest_window.set_input_values_from_location(
+                self._journal.last_target
+            )
 
-        window.from_target_button.pressed.connect(set_input_from_target)
-        window.from_location_button.pressed.connect(set_input_from_location)
-        window.show()
+    @QtCore.Slot()
+    def _set_nearest_input_from_location(self) -> None:
+        """Set the nearest window's coordinates from the journal's current location."""
+        if self._journal is not None:
+            self._nearest_window.set_input_values_from_location(self._journal.location)
 
     def _spansh_error_callback(self, error_message: str) -> None:
         """Display `error_message` in the status bar."""
@@ -541,18 +560,28 @@ class ExactTab(SpanshTabBase, ExactTabGUI):  # noqa: D101
     def __init__(self, *args: object, **kwargs: object):
         super().__init__(*args, **kwargs)
         self.use_clipboard_checkbox.stateChanged.connect(self._set_submit_sensitive)
+        # The last successfully parsed clipboard and its ship, reused when submitting without a clipboard change.
+        self._clipboard_ship: tuple[str, Ship] | None = None
 
     def _request_params(self) -> dict[str, t.Any] | None:
         if self.use_clipboard_checkbox.checked:
             clipboard = get_application().clipboard().text()
-            try:
-                ship = Ship.from_coriolis(json.loads(clipboard))
-            except Exception as e:
-                self._status_callback(_("Invalid ship data in clipboard."), 5_000)
-                log.warning(
-                    f"Failed to parse ship JSON clipboard: {clipboard!r}", exc_info=e
-                )
-                return
+            if (
+                self._clipboard_ship is not None
+                and self._clipboard_ship[0] == clipboard
+            ):
+                ship = self._clipboard_ship[1]
+            else:
+                try:
+                    ship = Ship.from_coriolis(json_loads(clipboard))
+                except Exception as e:
+                    self._status_callback(_("Invalid ship data in clipboard."), 5_000)
+                    log.warning(
+                        f"Failed to parse ship JSON clipboard: {clipboard!r}",
+                        exc_info=e,
+                    )
+                    return
+                self._clipboard_ship = (clipboard, ship)
         else:
             ship = self._journal.ship
         return {
@@ -562,14 +591,7 @@ class ExactTab(SpanshTabBase, ExactTabGUI):  # noqa: D101
             "use_supercharge": int(self.supercarge_checkbox.checked),
             "use_injections": int(self.fsd_injections_checkbox.checked),
             "exclude_secondary": int(self.exclude_secondary_checkbox.checked),
-            "fuel_power": ship.fsd.size_const,
-            "fuel_multiplier": ship.fsd.rating_const / 1000,
-            "optimal_mass": ship.fsd.optimal_mass,
-            "base_mass": ship.unladen_mass + ship.reserve_size,
-            "tank_size": ship.tank_size,
-            "internal_tank_size": ship.reserve_size,
-            "max_fuel_per_jump": ship.fsd.max_fuel_usage,
-            "range_boost": ship.jump_range_boost,
+            **ship.spansh_exact_params,
             "cargo": self.cargo_slider.value,
         }
 
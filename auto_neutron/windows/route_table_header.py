@@ -5,7 +5,7 @@ import dataclasses
 import typing as t
 from functools import cached_property
 
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtWidgets
 from __feature__ import snake_case, true_property  # noqa: F401
 
 from auto_neutron.route import (
@@ -45,22 +45,20 @@ class RouteTableHeader:
     """
 
     _header_sections: t.ClassVar[tuple[HeaderSection, ...]]
+    # Whether the width of the jump column's cells can be kept between jumps,
+    # only safe when the column holds short values like jump counts.
+    _cache_jump_col_width: t.ClassVar[bool] = False
 
-    def __init__(self, table: QtWidgets.QTableWidget):
+    def __init__(self, table: QtWidgets.QTableView):
         self._table = table
+        self._model = table.model()
         self._remaining_jumps: int | None = None
         self._total_jumps: int | None = None
+        self._jump_col_contents_width: int | None = None
         self._delegates = []
 
     def initialize_headers(self) -> None:
-        """Initialize the table's columns and headers."""
-        self._table.column_count = self.column_count
-        for column in range(self.column_count):
-            if self._table.horizontal_header_item(column) is None:
-                self._table.set_horizontal_header_item(
-                    column, QtWidgets.QTableWidgetItem()
-                )
-
+        """Initialize the table's header sections."""
         header = self._table.horizontal_header()
         for index, header_section in enumerate(self._header_sections):
             header.set_section_resize_mode(index, header_section.resize_mode)
@@ -76,32 +74,60 @@ class RouteTableHeader:
     def retranslate_headers(self) -> None:
         """Retranslate the headers of the table."""
         for index, header_section in enumerate(self._header_sections):
-            if (
-                not header_section.has_jumps
-                and (header := self._table.horizontal_header_item(index)) is not None
-            ):
-                header.set_text(_(header_section.text))
+            if not header_section.has_jumps:
+                self._model.set_header_data(
+                    index, QtCore.Qt.Orientation.Horizontal, _(header_section.text)
+                )
 
         self.format_jump_header()
 
-    def item_changed(self, item: QtWidgets.QTableWidgetItem) -> None:
+    def item_changed(self, index: QtCore.QModelIndex) -> None:
         """
-        Update the headers after a change to `item`.
+        Update the headers after a change to the item at `index`.
 
         By default resizes the first column if the changes was in that column.
         """
-        if item.column() == 0:
+        if index.column() == 0:
             self._table.resize_column_to_contents(0)
+        if index.column() == self._jump_col_index:
+            self._jump_col_contents_width = None
 
     def format_jump_header(self) -> None:
-        """Update the header with the jump information."""
-        self._table.horizontal_header_item(self._jump_col_index).set_text(
+        """
+        Update the header with the jump information and resize its column to fit.
+
+        If `_cache_jump_col_width` is set, the width of the column's cells is measured once
+        and kept until one of them is changed, only the header's new size is checked on later updates.
+        """
+        self._model.set_header_data(
+            self._jump_col_index,
+            QtCore.Qt.Orientation.Horizontal,
             _(self._header_sections[self._jump_col_index].text).format(
                 self._remaining_jumps,
                 self._total_jumps,
+            ),
+        )
+        if not self._cache_jump_col_width:
+            self._table.resize_column_to_contents(self._jump_col_index)
+            return
+
+        if self._jump_col_contents_width is None:
+            self._jump_col_contents_width = self._table.size_hint_for_column(
+                self._jump_col_index
             )
+        header = self._table.horizontal_header()
+        header.resize_section(
+            self._jump_col_index,
+            max(
+                self._jump_col_contents_width,
+                header.section_size_hint(self._jump_col_index),
+            ),
         )
-        self._table.resize_column_to_contents(self._jump_col_index)
+
+    def reset_column_widths(self) -> None:
+        """Remeasure the jump column's cells, e.g. after the table's font changed."""
+        self._jump_col_contents_width = None
+        self.format_jump_header()
 
     @property
     def column_count(self) -> int:
@@ -131,6 +157,7 @@ class GenericHeader(RouteTableHeader):
 class NeutronHeader(RouteTableHeader):
     """Table header for neutron plots."""
 
+    _cache_jump_col_width = True
     _header_sections = (
         HeaderSection(text="System name"),
         HeaderSection(
@@ -180,6 +207,7 @@ class ExactHeader(RouteTableHeader):
 class RoadToRichesHeader(RouteTableHeader):
     """Table header for exact plots."""
 
+    _cache_jump_col_width = True
     _header_sections = (
         HeaderSection(text=N_("System name")),
         HeaderSection(text=N_("Body count"), delegate_type=SpinBoxDelegate),
@@ -0,0 +1,140 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+from __future__ import annotations
+
+import typing as t
+
+from PySide6 import QtCore, QtGui
+from __feature__ import snake_case, true_property  # noqa: F401
+
+if t.TYPE_CHECKING:
+    from auto_neutron.route import SystemEntry
+
+_INACTIVE_BRUSH = QtGui.QBrush(QtGui.QColor(150, 150, 150))
+
+
+class RouteTableModel(QtCore.QAbstractTableModel):
+    """
+    Table model displaying route entries.
+
+    The entries are not copied, edits through the model are written directly into them.
+    `item_edited` is only emitted for changes done through `set_data`.
+    """
+
+    item_edited = QtCore.Signal(QtCore.QModelIndex)
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._entries: list[SystemEntry] = []
+        self._column_count = 0
+        self._header_texts: dict[int, str] = {}
+        self._inactive_before = 0
+
+    def set_entries(self, entries: list[SystemEntry], column_count: int) -> None:
+        """Reset the model to display `column_count` columns of `entries`."""
+        self.begin_reset_model()
+        self._entries = entries
+        self._column_count = column_count
+        self._header_texts.clear()
+        self._inactive_before = 0
+        self.end_reset_model()
+
+    def inactivate_before_index(self, index: int) -> None:
+        """Make all the rows before `index` grey, and after, the default color."""
+        assert index <= len(self._entries), f"Index {index} out of range."
+        self._inactive_before = index
+        if self._entries:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._entries) - 1, self._column_count - 1),
+                [QtCore.Qt.ItemDataRole.ForegroundRole],
+            )
+
+    def row_count(  # noqa: D102
+        self, parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = None
+    ) -> int:
+        if parent is not None and parent.is_valid():
+            return 0
+        return len(self._entries)
+
+    def column_count(  # noqa: D102
+        self, parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = None
+    ) -> int:
+        if parent is not None and parent.is_valid():
+            return 0
+        return self._column_count
+
+    def data(  # noqa: D102
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> t.Any:
+        if role in {
+            QtCore.Qt.ItemDataRole.DisplayRole,
+            QtCore.Qt.ItemDataRole.EditRole,
+        }:
+            return self._entries[index.row()][index.column()]
+        elif role == QtCore.Qt.ItemDataRole.TextAlignmentRole:
+            return QtCore.Qt.AlignmentFlag.AlignCenter
+        elif (
+            role == QtCore.Qt.ItemDataRole.ForegroundRole
+            and index.row() < self._inactive_before
+        ):
+            return _INACTIVE_BRUSH
+        return None
+
+    def set_data(  # noqa: D102
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+        value: t.Any,
+        role: int = QtCore.Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        if role != QtCore.Qt.ItemDataRole.EditRole or not index.is_valid():
+            return False
+        self._entries[index.row()][index.column()] = value
+        self.dataChanged.emit(index, index)
+        self.item_edited.emit(index)
+        return True
+
+    def flags(  # noqa: D102
+        self, index: QtCore.QModelIndex | QtCore.QPersistentModelIndex
+    ) -> QtCore.Qt.ItemFlag:
+        if not index.is_valid():
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        return (
+            QtCore.Qt.ItemFlag.ItemIsEnabled
+            | QtCore.Qt.ItemFlag.ItemIsSelectable
+            | QtCore.Qt.ItemFlag.ItemIsEditable
+        )
+
+    def header_data(  # noqa: D102
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> t.Any:
+        if (
+            orientation == QtCore.Qt.Orientation.Horizontal
+            and role == QtCore.Qt.ItemDataRole.DisplayRole
+        ):
+            return self._header_texts.get(section)
+        return super().header_data(section, orientation, role)
+
+    def set_header_data(  # noqa: D102
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        value: t.Any,
+        role: int = QtCore.Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        if orientation != QtCore.Qt.Orientation.Horizontal or role not in {
+            QtCore.Qt.ItemDataRole.DisplayRole,
+            QtCore.Qt.ItemDataRole.EditRole,
+        }:
+            return False
+        if self._header_texts.get(section) == value:
+            return True
+        self._header_texts[section] = value
+        self.headerDataChanged.emit(orientation, section, section)
+        return True
@@ -5,11 +5,10 @@ from __future__ import annotations
 
 from functools import partial
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 from __feature__ import snake_case, true_property  # noqa: F401
 
 from auto_neutron.journal import Journal, get_unique_cmdr_journals
-from auto_neutron.utils.signal import ReconnectingSignal
 from auto_neutron.utils.utils import cmdr_display_name, get_application
 
 from ..workers import GameWorker
@@ -31,10 +30,7 @@ class ShutDownWindow(ShutDownWindowGUI):
         self._journal_shutdown_connection: QtCore.QMetaObject.Connection | None = None
         self._journal_worker: GameWorker | None = None
         self._journals = []
-        self.journal_changed_signal = ReconnectingSignal(
-            self.journal_combo.currentIndexChanged, self._change_journal
-        )
-        self.journal_changed_signal.connect()
+        self.journal_combo.currentIndexChanged.connect(self._change_journal)
         self.new_journal_button.pressed.connect(
             lambda: self.new_journal_signal.emit(self._selected_journal)
         )
@@ -68,7 +64,7 @@ class ShutDownWindow(ShutDownWindowGUI):
                 )
             )
         self._change_journal(0)
-        with self.journal_changed_signal.temporarily_disconnect():
+        with QtCore.QSignalBlocker(self.journal_combo):
             self.journal_combo.clear()
             self.journal_combo.add_items(combo_items)
 
@@ -92,12 +88,12 @@ class ShutDownWindow(ShutDownWindowGUI):
         )
         self._selected_journal = journal
 
+    def close_event(self, event: QtGui.QCloseEvent) -> None:
+        """Stop the journal worker on close."""
+        if self._journal_worker is not None:
+            self._journal_worker.stop()
+
     def change_event(self, event: QtCore.QEvent) -> None:
         """Retranslate the GUI when a language change occurs."""
         if event.type() == QtCore.QEvent.Type.LanguageChange:
             self.retranslate()
-
-    def retranslate(self) -> None:
-        """Retranslate text that is always on display."""
-        with self.journal_changed_signal.temporarily_disconnect():
-            super().retranslate()
@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import contextlib
-import json
 import logging
 import typing as t
 from functools import partial
@@ -15,6 +14,7 @@ from __feature__ import snake_case, true_property  # noqa: F401
 from auto_neutron import settings
 from auto_neutron.constants import STATUS_PATH
 from auto_neutron.route import Route
+from auto_neutron.utils.utils import json_loads
 
 if t.TYPE_CHECKING:
     import collections.abc
@@ -39,6 +39,8 @@ class _WorkerBase(QtCore.QObject):
         self._timer = QtCore.QTimer(self)
         self._timer.interval = interval
         self._timer.timeout.connect(partial(next, self._generator))
+        # Close the generator even if the worker is deleted without being stopped.
+        self.destroyed.connect(self._generator.close)
         self._stopped = False
 
     def start(self) -> None:
@@ -100,11 +102,11 @@ class StatusWorker(_WorkerBase):
     def read_status(self) -> collections.abc.Generator[None, None, None]:
         """Emit status_signal with the status dict on every status file change."""
         last_content = None
-        with open(STATUS_PATH, encoding="utf8") as file:
+        with open(STATUS_PATH, "rb") as file:
             while True:
                 file.seek(0)
                 content = file.read()
                 if content and content != last_content:
-                    self.status_signal.emit(json.loads(content))
+                    self.status_signal.emit(json_loads(content))
                     last_content = content
                 yield